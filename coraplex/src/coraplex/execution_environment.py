@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+
+from typing_extensions import ClassVar, Optional, Tuple
 
 from coraplex.datastructures.enums import ExecutionType
-from coraplex.plans.executables import GiskardExecutable
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +16,9 @@ class ExecutionEnvironment:
     """
     Base class for managing execution context of all actions within.
 
-    Instances of this class is to be used with a "with" context block
+    Instances of this class is to be used with a "with" context block. The settings
+    are stored per thread and per asyncio task, so concurrent plans can run in
+    different environments.
 
     Example:
 
@@ -34,38 +38,49 @@ class ExecutionEnvironment:
     environment.
     """
 
-    previous_type: ExecutionType = field(init=False, default=None)
+    _active_environments: ClassVar[ContextVar[Tuple[ExecutionEnvironment, ...]]] = (
+        ContextVar("active_execution_environments", default=())
+    )
     """
-    Type of the execution environment before setting it, used for nested environments.
+    Snapshots of the entered and not yet exited environments, innermost last.
     """
 
-    previous_collision_avoidance: bool = field(init=False, default=False)
-    """
-    Collision avoidance setting before entering this environment, used for nested
-    environments.
-    """
+    @classmethod
+    def current_execution_type(cls) -> Optional[ExecutionType]:
+        """
+        :return: The execution type of the innermost active environment, or None if no
+            environment is active.
+        """
+        active_environments = cls._active_environments.get()
+        if not active_environments:
+            return None
+        return active_environments[-1].execution_type
+
+    @classmethod
+    def current_collision_avoidance(cls) -> bool:
+        """
+        :return: Whether the innermost active environment adds external collision
+            avoidance to motion state charts.
+        """
+        active_environments = cls._active_environments.get()
+        if not active_environments:
+            return False
+        return active_environments[-1].collision_avoidance
 
     def __enter__(self):
         """
-        Entering function for 'with' scope, saves the previously set
-        :py:attr:`~pycram.plans.executables.GiskardExecutable.execution_type` and
-        :py:attr:`~pycram.plans.executables.GiskardExecutable.collision_avoidance` and
-        sets them to the values of this environment.
+        Entering function for 'with' scope, activates a snapshot of this environment
+        on top of the previously active ones.
         """
-        self.previous_type = GiskardExecutable.execution_type
-        self.previous_collision_avoidance = GiskardExecutable.collision_avoidance
-        GiskardExecutable.execution_type = self.execution_type
-        GiskardExecutable.collision_avoidance = self.collision_avoidance
+        self._active_environments.set(
+            self._active_environments.get() + (replace(self),)
+        )
 
     def __exit__(self, _type, value, traceback):
         """
-        Exit method for the 'with' scope, restores the
-        :py:attr:`~pycram.plans.executables.GiskardExecutable.execution_type` and
-        :py:attr:`~pycram.plans.executables.GiskardExecutable.collision_avoidance` to
-        the previously used values.
+        Exit method for the 'with' scope, restores the previously active environment.
         """
-        GiskardExecutable.execution_type = self.previous_type
-        GiskardExecutable.collision_avoidance = self.previous_collision_avoidance
+        self._active_environments.set(self._active_environments.get()[:-1])
 
     def __call__(self, collision_avoidance: bool = False):
         """
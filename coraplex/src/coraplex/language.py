@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import atexit
+import contextvars
 import logging
 import threading
 import time
@@ -121,13 +122,16 @@ class ExecutesInParallel(LanguageNode, ABC):
     def _perform_parallel(cls, nodes: List[PlanNode]):
         """
         Open threads for all nodes and wait for them to finish.
+        Each thread runs in a copy of the current context, such that the children see
+        the enclosing execution environment.
 
         :param nodes: A list of nodes which should be performed in parallel
         """
         threads = []
         for child in nodes:
             thread = threading.Thread(
-                target=child.perform,
+                target=contextvars.copy_context().run,
+                args=(child.perform,),
             )
             thread.start()
             threads.append(thread)
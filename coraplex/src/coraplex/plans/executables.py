@@ -6,7 +6,7 @@ import time
 from dataclasses import dataclass, field
 from datetime import timedelta
 
-from typing_extensions import List, Dict, ClassVar, Optional, TYPE_CHECKING
+from typing_extensions import List, Dict, Optional, TYPE_CHECKING
 
 from giskardpy.motion_statechart.context import MotionStatechartContext
 from giskardpy.motion_statechart.data_types import (
@@ -23,6 +23,7 @@ from giskardpy.qp.qp_controller_config import QPControllerConfig
 from giskardpy.ros_executor import Ros2Executor
 from krrood.entity_query_language.factories import evaluate_condition
 from coraplex.datastructures.enums import ExecutionType
+from coraplex.execution_environment import ExecutionEnvironment
 from coraplex.exceptions import (
     MotionDidNotFinish,
     ConditionNotSatisfied,
@@ -51,6 +52,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_SKIP_STATES = frozenset({LifeCycleValues.DONE, LifeCycleValues.NOT_STARTED})
+"""
+Life cycle states of nodes that are not reported as failed when a motion does not finish.
+"""
+
 
 @dataclass
 class Executable:
@@ -82,7 +88,7 @@ class Executable:
         Executes the unit.
         """
         for executable in self.execution_list:
-            if GiskardExecutable.execution_type == ExecutionType.REAL:
+            if ExecutionEnvironment.current_execution_type() == ExecutionType.REAL:
                 time.sleep(self.synchronize_time_delta.seconds)
             executable.execute()
 
@@ -116,19 +122,6 @@ class GiskardExecutable(Executable):
     if the condition is observed to hold, otherwise it is aborted.
     """
 
-    execution_type: ClassVar[Optional[ExecutionType]] = None
-    """
-    The execution type used for all giskard executables, managed by
-    :py:class:`pycram.motion_executor.ExecutionEnvironment`.
-    """
-
-    collision_avoidance: ClassVar[bool] = False
-    """
-    Whether an :class:`~giskardpy.motion_statechart.goals.collision_avoidance.ExternalCo
-    llisionAvoidance` is added to the motion state chart, managed by
-    :py:class:`pycram.motion_executor.ExecutionEnvironment`.
-    """
-
     _current_motion_state_chart: MotionStatechart = field(init=False, default=None)
     """
     Currently build motion state chart, internal only for managing the building the msc.
@@ -149,7 +142,8 @@ class GiskardExecutable(Executable):
           the motion if either condition is observed to be false.
         """
         self._current_motion_state_chart = MotionStatechart()
-        if self.execution_type == ExecutionType.REAL:
+        execution_type = ExecutionEnvironment.current_execution_type()
+        if execution_type == ExecutionType.REAL:
             self._current_motion_state_chart.add_node(
                 seq := Sequence(list(self.motion_mappings.values()))
             )
@@ -163,7 +157,7 @@ class GiskardExecutable(Executable):
 
         end_trigger = tasks[-1].observation_variable
 
-        if self.execution_type == ExecutionType.SIMULATED:
+        if execution_type == ExecutionType.SIMULATED:
             skip_end_conditions = self._add_pause_interrupt(tasks)
 
             # The motion is done when the last task finished or the first skipped
@@ -172,7 +166,7 @@ class GiskardExecutable(Executable):
                 end_trigger = trinary_logic_or(end_trigger, *skip_end_conditions)
 
             self._add_condition_monitors(first_task, end_trigger)
-        if GiskardExecutable.collision_avoidance:
+        if ExecutionEnvironment.current_collision_avoidance():
             self._current_motion_state_chart.add_node(ExternalCollisionAvoidance())
 
         end_motion = EndMotion()
@@ -305,7 +299,8 @@ class GiskardExecutable(Executable):
         if len(self.motion_mappings) == 0:
             return
 
-        match GiskardExecutable.execution_type:
+        execution_type = ExecutionEnvironment.current_execution_type()
+        match execution_type:
             case ExecutionType.SIMULATED:
                 self._execute_simulation()
             case ExecutionType.REAL:
@@ -313,7 +308,7 @@ class GiskardExecutable(Executable):
             case ExecutionType.NO_EXECUTION:
                 return
             case _:
-                raise UnknownExecutionType(GiskardExecutable.execution_type)
+                raise UnknownExecutionType(execution_type)
 
     def _execute_simulation(self) -> None:
         """
@@ -356,8 +351,7 @@ class GiskardExecutable(Executable):
             failed_nodes = [
                 node
                 for node in motion_state_chart.nodes
-                if node.life_cycle_state
-                not in [LifeCycleValues.DONE, LifeCycleValues.NOT_STARTED]
+                if node.life_cycle_state not in _SKIP_STATES
             ]
             logger.error(f"Failed Nodes: {failed_nodes}")
             raise MotionDidNotFinish(failed_nodes)
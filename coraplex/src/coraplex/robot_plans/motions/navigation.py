@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from coraplex.datastructures.enums import ExecutionType
-from coraplex.plans.executables import GiskardExecutable
+from coraplex.execution_environment import ExecutionEnvironment
 from giskardpy.motion_statechart.monitors.overwrite_state_monitors import (
     SetOdometry,
     SetSeedConfiguration,
@@ -37,7 +37,7 @@ class MoveMotion(BaseMotion):
                 base_pose=self.target.to_homogeneous_matrix(),
                 odom_connection=self.robot.root.parent_connection,
             )
-            if GiskardExecutable.execution_type == ExecutionType.SIMULATED
+            if ExecutionEnvironment.current_execution_type() == ExecutionType.SIMULATED
             and self.context.teleport_to_navigate_in_simulation
             else CartesianPose(
                 root_link=self.world.root,
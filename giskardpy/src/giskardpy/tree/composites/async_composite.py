@@ -7,7 +7,6 @@ from typing import Optional
 import rclpy
 from py_trees import behaviour
 from py_trees.behaviour import Behaviour
-from line_profiler import profile
 from py_trees.common import Status
 from py_trees.composites import Composite
 from py_trees.decorators import SuccessIsRunning
@@ -121,7 +120,6 @@ class AsyncBehavior(GiskardBehavior, Composite):
     def tip(self):
         return GiskardBehavior.tip(self)
 
-    @profile
     def loop_over_plugins(self) -> None:
         try:
             self.get_blackboard().runtime = time()
@@ -24,6 +24,8 @@ def to_camel_case(name: str) -> str:
     """Convert snake_case to CamelCase. E.g. ``'my_func'`` → ``'MyFunc'``."""
     if len(name) == 0:
         return name
+    if "_" not in name:
+        return name[0].upper() + name[1:]
     return inflection.camelize(name, True)
 
 
@@ -219,15 +219,16 @@ class GroupedBy(MultiArityExpressionThatPerformsACartesianProduct):
         :param group: The group to be updated.
         :param results: The results to be added to the group.
         """
+        group_bindings = group.bindings
         for id_, val in results.items():
-            if id_ in self.ids_of_variables_to_group_by:
-                group[id_] = val
+            if id_ in self._id_set_of_variables_to_group_by_:
+                group_bindings[id_] = val
             elif self.is_already_grouped(id_):
-                group[id_] = val if is_iterable(val) else [val]
+                group_bindings[id_] = val if is_iterable(val) else [val]
+            elif id_ in group_bindings:
+                group_bindings[id_].append(val)
             else:
-                if id_ not in group:
-                    group[id_] = []
-                group[id_].append(val)
+                group_bindings[id_] = [val]
 
     @memoize
     def is_already_grouped(self, var_id: uuid.UUID) -> bool:
@@ -279,6 +280,14 @@ class GroupedBy(MultiArityExpressionThatPerformsACartesianProduct):
         """
         return tuple(var._id_ for var in self.variables_to_group_by)
 
+    @cached_property
+    def _id_set_of_variables_to_group_by_(self) -> FrozenSet[uuid.UUID]:
+        """
+        :return: The binding IDs of the variables to group by, for membership tests on every
+            grouped row.
+        """
+        return frozenset(self.ids_of_variables_to_group_by)
+
     @cached_property
     def group_key_root_ids(self) -> Set[uuid.UUID]:
         """
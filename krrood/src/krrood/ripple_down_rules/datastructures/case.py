@@ -222,12 +222,11 @@ def create_cases_from_dataframe(
     :param name: The semantic name of the DataFrame that describes the DataFrame.
     :return: The cases of the DataFrame.
     """
-    cases = []
-    attribute_names = list(df.columns)
-    for row_id, case in df.iterrows():
-        case = {col_name: case[col_name].item() for col_name in attribute_names}
-        cases.append(Case(DataFrame, _id=row_id, _name=name, **case))
-    return cases
+    records = df.to_dict(orient="records")
+    return [
+        Case(DataFrame, _id=row_id, _name=name, **record)
+        for row_id, record in zip(df.index, records)
+    ]
 
 
 def create_case(
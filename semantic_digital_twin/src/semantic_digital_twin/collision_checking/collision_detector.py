@@ -48,7 +48,7 @@ class CollisionCheckingResult:
         return len(self.contacts) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ClosestPoints:
     """
     Encapsulates the closest points data between two bodies returned by the collision
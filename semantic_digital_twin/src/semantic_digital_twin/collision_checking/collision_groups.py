@@ -59,7 +59,7 @@ class CollisionGroup:
         return item == self.root or item in self.bodies
 
     def __hash__(self):
-        return hash((self.root, tuple(sorted(self.bodies, key=lambda b: b.id))))
+        return hash(self.root)
 
     def add_body(self, body: Body):
         if body.has_collision():
@@ -99,6 +99,13 @@ class CollisionGroupConsumer(CollisionConsumer, ABC):
     Collision groups defined by this post processor.
     """
 
+    _body_to_collision_group: dict[KinematicStructureEntity, CollisionGroup] = field(
+        default_factory=dict, init=False
+    )
+    """
+    Maps every group root and group body to the collision group it belongs to.
+    """
+
     def on_world_model_update(self, world: World):
         self.update_collision_groups(world)
 
@@ -110,7 +117,9 @@ class CollisionGroupConsumer(CollisionConsumer, ABC):
         """
         body_to_robot = world.robot_body_to_robot_mapping
 
-        self.collision_groups = [CollisionGroup(world.root)]
+        root_group = CollisionGroup(world.root)
+        self.collision_groups = [root_group]
+        self._body_to_collision_group = {world.root: root_group}
         for parent, children in rustworkx.bfs_successors(
             world.kinematic_structure, world.root.index
         ):
@@ -119,10 +128,12 @@ class CollisionGroupConsumer(CollisionConsumer, ABC):
                 if parent_C_child.is_controlled or body_to_robot.get(
                     parent
                 ) != body_to_robot.get(child):
-                    self.collision_groups.append(CollisionGroup(child))
+                    collision_group = CollisionGroup(child)
+                    self.collision_groups.append(collision_group)
                 else:
                     collision_group = self.get_collision_group(parent)
                     collision_group.bodies.add(child)
+                self._body_to_collision_group[child] = collision_group
 
         for group in self.collision_groups:
             group.bodies = set(
@@ -132,6 +143,11 @@ class CollisionGroupConsumer(CollisionConsumer, ABC):
         self.collision_groups = [
             group for group in self.collision_groups if len(group.bodies) > 0
         ]
+        self._body_to_collision_group = {
+            body: group
+            for group in self.collision_groups
+            for body in (group.root, *group.bodies)
+        }
 
     def get_collision_group(self, body: KinematicStructureEntity) -> CollisionGroup:
         """
@@ -140,7 +156,7 @@ class CollisionGroupConsumer(CollisionConsumer, ABC):
         :param body: the body for which to get the collision group.
         :return: the collision group for the given body.
         """
-        for group in self.collision_groups:
-            if body in group:
-                return group
-        raise Exception(f"No collision group found for {body}")
+        collision_group = self._body_to_collision_group.get(body)
+        if collision_group is None:
+            raise Exception(f"No collision group found for {body}")
+        return collision_group
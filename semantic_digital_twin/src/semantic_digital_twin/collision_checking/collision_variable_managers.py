@@ -1,3 +1,4 @@
+import heapq
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -19,7 +20,10 @@ from semantic_digital_twin.collision_checking.collision_groups import (
 )
 from semantic_digital_twin.spatial_types import Vector3, Point3
 from semantic_digital_twin.spatial_types.math import inverse_frame
-from semantic_digital_twin.world_description.world_entity import Body
+from semantic_digital_twin.world_description.world_entity import (
+    Body,
+    KinematicStructureEntity,
+)
 
 
 @dataclass
@@ -61,6 +65,14 @@ class BaseCollisionVariableManager(CollisionGroupConsumer, ABC):
     A block that is used to reset the collision data.
     """
 
+    _group_T_root_cache: dict[KinematicStructureEntity, np.ndarray] = field(
+        default_factory=dict, init=False
+    )
+    """
+    Transforms from the world root to the roots of collision groups, valid for the
+    current collision computation.
+    """
+
     def __post_init__(self):
         self._single_reset_block = np.zeros(self.block_size)
         self._single_reset_block[self.get_contact_distance_offset()] = 100
@@ -110,6 +122,22 @@ class BaseCollisionVariableManager(CollisionGroupConsumer, ABC):
         Resets the collision data buffer to the default values.
         """
         self.float_variable_data.data[self._reset_indices] = self._reset_values
+        self._group_T_root_cache.clear()
+
+    def compute_group_T_root(self, group: CollisionGroup) -> np.ndarray:
+        """
+        Computes the transform from the world root to the root of a collision group.
+        The result is reused until the collision data is reset.
+
+        :param group: The collision group whose root frame is the target frame.
+        :return: The 4x4 transform group_T_root.
+        """
+        group_T_root = self._group_T_root_cache.get(group.root)
+        if group_T_root is None:
+            world = group.root._world
+            group_T_root = world.compute_forward_kinematics_np(group.root, world.root)
+            self._group_T_root_cache[group.root] = group_T_root
+        return group_T_root
 
     def on_collision_matrix_update(self):
         pass
@@ -183,22 +211,24 @@ class ExternalCollisionVariableManager(BaseCollisionVariableManager):
             self.last_closest_contacts[group_a].append(collision)
 
         for group_a, collisions in self.last_closest_contacts.items():
-            collisions = sorted(collisions, key=lambda c: c.distance)
-            for i in range(
-                min(
-                    len(collisions),
-                    group_a.get_max_avoided_bodies(self.collision_manager),
-                )
-            ):
-                collision = collisions[i]
-                group_a_T_root = group_a.root._world.compute_forward_kinematics_np(
-                    group_a.root, group_a.root._world.root
-                )
-                group_a_P_pa = group_a_T_root @ collision.root_P_point_on_body_a
+            collisions = heapq.nsmallest(
+                group_a.get_max_avoided_bodies(self.collision_manager),
+                collisions,
+                key=lambda collision: collision.distance,
+            )
+            self.last_closest_contacts[group_a] = collisions
+            if not collisions:
+                continue
+            group_a_T_root = self.compute_group_T_root(group_a)
+            group_a_P_pa = (
+                np.stack([c.root_P_point_on_body_a for c in collisions])
+                @ group_a_T_root.T
+            )
+            for i, collision in enumerate(collisions):
                 self.insert_data_block(
                     group=group_a,
                     idx=i,
-                    group_a_P_point_on_a=group_a_P_pa,
+                    group_a_P_point_on_a=group_a_P_pa[i],
                     root_V_contact_normal=collision.root_V_contact_normal_from_b_to_a,
                     contact_distance=collision.distance,
                     buffer_distance=self.collision_manager.get_buffer_zone_distance(
@@ -392,33 +422,46 @@ class SelfCollisionVariableManager(BaseCollisionVariableManager):
                 continue
             self.last_closest_contacts[key].append(collision)
 
-        for key, collisions in self.last_closest_contacts.items():
-            self.last_closest_contacts[key] = sorted(
-                collisions, key=lambda c: c.distance
-            )
-
-        for (group_a, group_b), collisions in self.last_closest_contacts.items():
-            closest_contact = collisions[0]
-            group_a_T_root = group_a.root._world.compute_forward_kinematics_np(
-                group_a.root, group_a.root._world.root
-            )
-            group_a_P_pa = group_a_T_root @ closest_contact.root_P_point_on_body_a
-
-            group_b_T_root = group_b.root._world.compute_forward_kinematics_np(
-                group_b.root, group_b.root._world.root
-            )
-            group_b_P_pb = group_b_T_root @ closest_contact.root_P_point_on_body_b
+        for collisions in self.last_closest_contacts.values():
+            collisions.sort(key=lambda collision: collision.distance)
 
-            group_b_V_contact_normal = (
-                group_b_T_root @ closest_contact.root_V_contact_normal_from_b_to_a
-            )
+        if not self.last_closest_contacts:
+            return
+        group_pairs = list(self.last_closest_contacts)
+        closest_contacts = [
+            collisions[0] for collisions in self.last_closest_contacts.values()
+        ]
+        groups_a_T_root = np.stack(
+            [self.compute_group_T_root(group_a) for group_a, _ in group_pairs]
+        )
+        groups_b_T_root = np.stack(
+            [self.compute_group_T_root(group_b) for _, group_b in group_pairs]
+        )
+        groups_a_P_pa = np.einsum(
+            "bij,bj->bi",
+            groups_a_T_root,
+            np.stack([c.root_P_point_on_body_a for c in closest_contacts]),
+        )
+        groups_b_P_pb = np.einsum(
+            "bij,bj->bi",
+            groups_b_T_root,
+            np.stack([c.root_P_point_on_body_b for c in closest_contacts]),
+        )
+        groups_b_V_contact_normal = np.einsum(
+            "bij,bj->bi",
+            groups_b_T_root,
+            np.stack([c.root_V_contact_normal_from_b_to_a for c in closest_contacts]),
+        )
 
+        for index, ((group_a, group_b), closest_contact) in enumerate(
+            zip(group_pairs, closest_contacts)
+        ):
             self.insert_data_block(
                 group_a=group_a,
                 group_b=group_b,
-                group_a_P_point_on_a=group_a_P_pa,
-                group_b_P_point_on_b=group_b_P_pb,
-                group_b_V_contact_normal=group_b_V_contact_normal,
+                group_a_P_point_on_a=groups_a_P_pa[index],
+                group_b_P_point_on_b=groups_b_P_pb[index],
+                group_b_V_contact_normal=groups_b_V_contact_normal[index],
                 contact_distance=closest_contact.distance,
                 buffer_distance=self.collision_manager.get_buffer_zone_distance(
                     closest_contact.body_a, closest_contact.body_b
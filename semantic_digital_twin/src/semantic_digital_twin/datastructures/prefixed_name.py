@@ -1,12 +1,18 @@
 from dataclasses import dataclass
 
-from typing_extensions import Optional
+from typing_extensions import ClassVar, Optional
 
 from krrood.entity_query_language.predicate import Symbol
 
 
 @dataclass
 class PrefixedName(Symbol):
+    _cache_instances_: ClassVar[bool] = False
+    """
+    Names are values that are created for every entity, state and lookup, so they are
+    not registered as instances in the symbol graph.
+    """
+
     name: str
     """
     The local name identifying the entity.
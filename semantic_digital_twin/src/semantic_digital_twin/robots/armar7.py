@@ -295,13 +295,13 @@ class Armar7LeftGripper(
 
         gripper_open = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_open", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [0.0] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 0.0),
             state_type=GripperState.OPEN,
         )
 
         gripper_close = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_close", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [1.57] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 1.57),
             state_type=GripperState.CLOSE,
         )
 
@@ -342,13 +342,13 @@ class Armar7RightGripper(
 
         gripper_open = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_open", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [0.0] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 0.0),
             state_type=GripperState.OPEN,
         )
 
         gripper_close = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_close", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [1.57] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 1.57),
             state_type=GripperState.CLOSE,
         )
 
@@ -289,7 +289,7 @@ class ICub3LeftHand(
 
         gripper_open = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_open", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [0.0] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 0.0),
             state_type=GripperState.OPEN,
         )
 
@@ -357,7 +357,7 @@ class ICub3RightHand(
 
         gripper_open = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_open", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [0.0] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 0.0),
             state_type=GripperState.OPEN,
         )
 
@@ -414,9 +414,7 @@ class ICub3LeftArm(Arm[ICub3LeftHand]):
     def setup_joint_states(self) -> List[JointState]:
         arm_park = JointState.from_mapping(
             name=PrefixedName("left_arm_park", prefix=self.name.name),
-            mapping=dict(
-                zip(self.active_connections, [0.0] * len(self.active_connections))
-            ),
+            mapping=dict.fromkeys(self.active_connections, 0.0),
             state_type=StaticJointState.PARK,
         )
         return [arm_park]
@@ -440,9 +438,7 @@ class ICub3RightArm(Arm[ICub3RightHand]):
     def setup_joint_states(self) -> List[JointState]:
         arm_park = JointState.from_mapping(
             name=PrefixedName("right_arm_park", prefix=self.name.name),
-            mapping=dict(
-                zip(self.active_connections, [0.0] * len(self.active_connections))
-            ),
+            mapping=dict.fromkeys(self.active_connections, 0.0),
             state_type=StaticJointState.PARK,
         )
         return [arm_park]
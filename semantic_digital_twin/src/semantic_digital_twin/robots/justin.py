@@ -234,13 +234,13 @@ class JustinLeftHand(
 
         gripper_open = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_open", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [0.0] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 0.0),
             state_type=GripperState.OPEN,
         )
 
         gripper_close = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_close", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [1.0] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 1.0),
             state_type=GripperState.CLOSE,
         )
 
@@ -278,13 +278,13 @@ class JustinRightHand(
 
         gripper_open = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_open", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [0.0] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 0.0),
             state_type=GripperState.OPEN,
         )
 
         gripper_close = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_close", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [1.0] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 1.0),
             state_type=GripperState.CLOSE,
         )
 
@@ -312,9 +312,7 @@ class JustinLeftArm(Arm[JustinLeftHand]):
     def setup_joint_states(self) -> List[JointState]:
         arm_park = JointState.from_mapping(
             name=PrefixedName("left_arm_park", prefix=self.name.name),
-            mapping=dict(
-                zip(self.active_connections, [0.0] * len(self.active_connections))
-            ),
+            mapping=dict.fromkeys(self.active_connections, 0.0),
             state_type=StaticJointState.PARK,
         )
         return [arm_park]
@@ -338,9 +336,7 @@ class JustinRightArm(Arm[JustinRightHand]):
     def setup_joint_states(self) -> List[JointState]:
         arm_park = JointState.from_mapping(
             name=PrefixedName("right_arm_park", prefix=self.name.name),
-            mapping=dict(
-                zip(self.active_connections, [0.0] * len(self.active_connections))
-            ),
+            mapping=dict.fromkeys(self.active_connections, 0.0),
             state_type=StaticJointState.PARK,
         )
         return [arm_park]
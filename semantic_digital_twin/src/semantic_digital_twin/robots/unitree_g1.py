@@ -206,13 +206,13 @@ class UnitreeG1LeftHand(
 
         gripper_open = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_open", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [0.0] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 0.0),
             state_type=GripperState.OPEN,
         )
 
         gripper_close = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_close", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [1.0] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 1.0),
             state_type=GripperState.CLOSE,
         )
 
@@ -251,13 +251,13 @@ class UnitreeG1RightHand(
 
         gripper_open = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_open", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [0.0] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 0.0),
             state_type=GripperState.OPEN,
         )
 
         gripper_close = JointState.from_mapping(
             name=PrefixedName(f"{self.name.name}_close", prefix=self.name.name),
-            mapping=dict(zip(gripper_joints, [1.0] * len(gripper_joints))),
+            mapping=dict.fromkeys(gripper_joints, 1.0),
             state_type=GripperState.CLOSE,
         )
 
@@ -287,9 +287,7 @@ class UnitreeG1LeftArm(Arm[UnitreeG1LeftHand]):
     def setup_joint_states(self) -> List[JointState]:
         arm_park = JointState.from_mapping(
             name=PrefixedName("left_arm_park", prefix=self.name.name),
-            mapping=dict(
-                zip(self.active_connections, [0.0] * len(self.active_connections))
-            ),
+            mapping=dict.fromkeys(self.active_connections, 0.0),
             state_type=StaticJointState.PARK,
         )
         return [arm_park]
@@ -317,9 +315,7 @@ class UnitreeG1RightArm(Arm[UnitreeG1RightHand]):
     def setup_joint_states(self) -> List[JointState]:
         arm_park = JointState.from_mapping(
             name=PrefixedName("right_arm_park", prefix=self.name.name),
-            mapping=dict(
-                zip(self.active_connections, [0.0] * len(self.active_connections))
-            ),
+            mapping=dict.fromkeys(self.active_connections, 0.0),
             state_type=StaticJointState.PARK,
         )
         return [arm_park]
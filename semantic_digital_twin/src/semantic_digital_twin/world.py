@@ -6,6 +6,7 @@ import inspect
 import logging
 import threading
 import uuid
+from collections import defaultdict
 from copy import deepcopy, copy
 from dataclasses import dataclass, field
 from functools import wraps, cached_property
@@ -1269,12 +1270,40 @@ class World(HasSimulatorProperties):
     def get_body_in_branch_by_name(
         self, branch_root: KinematicStructureEntity, name: Union[str, PrefixedName]
     ) -> Body:
-        bodies = [
+        searched_name = name.name if isinstance(name, PrefixedName) else name
+        bodies = self._get_bodies_of_branch_by_name(branch_root).get(searched_name)
+        if bodies is None:
+            # search the whole branch, such that the error suggests similar names
+            bodies = self._get_bodies_of_branch(branch_root)
+        return self._get_world_entity_by_name_from_iterable(name, bodies)
+
+    @memoize
+    def _get_bodies_of_branch(
+        self, branch_root: KinematicStructureEntity
+    ) -> List[Body]:
+        """
+        :param branch_root: The root of the branch.
+        :return: All bodies in the branch, including the root if it is a body.
+        """
+        return [
             kse
             for kse in self.get_kinematic_structure_entities_of_branch(branch_root)
             if isinstance(kse, Body)
         ]
-        return self._get_world_entity_by_name_from_iterable(name, bodies)
+
+    @memoize
+    def _get_bodies_of_branch_by_name(
+        self, branch_root: KinematicStructureEntity
+    ) -> Dict[str, List[Body]]:
+        """
+        :param branch_root: The root of the branch.
+        :return: A mapping from names without prefix to the bodies with that name in
+            the branch below the root.
+        """
+        bodies_by_name = defaultdict(list)
+        for body in self._get_bodies_of_branch(branch_root):
+            bodies_by_name[body.name.name].append(body)
+        return dict(bodies_by_name)
 
     @memoize
     def get_degree_of_freedom_by_name(
@@ -205,17 +205,16 @@ class WorldStateTrajectoryPlotter:
             )
         return dof_ids
 
-    def _should_plot_series(self, series: np.ndarray) -> bool:
+    def _select_series_to_plot(self, series: np.ndarray) -> np.ndarray:
         """
-        Decide whether to plot a DOF series according to suppression rules.
+        Decide for each DOF series whether to plot it according to suppression rules.
 
-        :param derivative: Derivative of the subplot
-        :param series: Data to be plotted.
-        :return: whether to plot the series.
+        :param series: Data to be plotted, with one column per DOF.
+        :return: Boolean mask with one entry per column of series.
         """
         if self.plot_constant_lines:
-            return True
-        return not np.all(series == float(series[0]))
+            return np.ones(series.shape[1], dtype=bool)
+        return np.any(series != series[0], axis=0)
 
     def _create_styles_for_degrees_of_freedom(
         self, dof_ids: List[UUID]
@@ -332,19 +331,24 @@ class WorldStateTrajectoryPlotter:
         :param t: Numpy array representing the time steps corresponding to the
             trajectory data.
         """
+        data = traj.data
+        columns = [traj._index[dof_id] for dof_id in dof_ids]
+        names = [
+            str(traj.world.get_degree_of_freedom_by_id(dof_id).name)
+            for dof_id in dof_ids
+        ]
         for axis, derivative in zip(axes, self.derivatives_to_plot):
             axis.grid(True, axis="x")
             axis.grid(True, axis="y")
-            # Collect series for all DOFs
-            for dof_id in dof_ids:
-                col = traj._index[dof_id]
-                y = traj.data[:, derivative, col].astype(float)
-                if derivative == Derivatives.position and self.center_positions:
-                    y = y - float(y[0])
-                if not self._should_plot_series(y):
+            # Slice the series of all DOFs at once, one column per DOF
+            series = data[:, derivative, columns].astype(float)
+            if derivative == Derivatives.position and self.center_positions:
+                series = series - series[0]
+            plot_mask = self._select_series_to_plot(series)
+            for dof_id, name, y, plot in zip(dof_ids, names, series.T, plot_mask):
+                if not plot:
                     continue
                 style = styles.get(dof_id, {})
-                name = str(traj.world.get_degree_of_freedom_by_id(dof_id).name)
                 # Support format strings
                 if "fmt" in style:
                     axis.plot(t, y, style["fmt"], label=name)
@@ -0,0 +1,38 @@
+from coraplex.datastructures.enums import ExecutionType
+from coraplex.execution_environment import ExecutionEnvironment, simulated_robot
+from coraplex.plans.factories import code, parallel
+
+
+def test_nested_environments_restore_outer_settings():
+    with ExecutionEnvironment(ExecutionType.SIMULATED, collision_avoidance=True):
+        with ExecutionEnvironment(ExecutionType.REAL):
+            assert ExecutionEnvironment.current_execution_type() == ExecutionType.REAL
+            assert not ExecutionEnvironment.current_collision_avoidance()
+        assert ExecutionEnvironment.current_execution_type() == ExecutionType.SIMULATED
+        assert ExecutionEnvironment.current_collision_avoidance()
+    assert ExecutionEnvironment.current_execution_type() is None
+
+
+def test_reconfiguring_shared_environment_keeps_entered_settings():
+    environment = ExecutionEnvironment(ExecutionType.SIMULATED)
+    with environment(collision_avoidance=True):
+        with environment(collision_avoidance=False):
+            assert not ExecutionEnvironment.current_collision_avoidance()
+        assert ExecutionEnvironment.current_collision_avoidance()
+
+
+def test_parallel_children_see_enclosing_environment(immutable_model_world):
+    _, _, context = immutable_model_world
+    observed_execution_types = []
+
+    def observe_execution_type():
+        observed_execution_types.append(ExecutionEnvironment.current_execution_type())
+
+    plan = parallel(
+        [code(observe_execution_type), code(observe_execution_type)],
+        context=context,
+    ).plan
+    with simulated_robot:
+        plan.perform()
+
+    assert observed_execution_types == [ExecutionType.SIMULATED] * 2
@@ -25,6 +25,7 @@ class TestToCamelCase:
             ("a", "A"),
             ("x", "X"),
             ("a_b_c", "ABC"),
+            ("alreadyCamel", "AlreadyCamel"),
             ("", ""),
         ],
     )
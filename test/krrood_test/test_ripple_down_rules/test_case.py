@@ -0,0 +1,21 @@
+from unittest import TestCase
+
+from pandas import DataFrame
+
+from krrood.ripple_down_rules.datastructures.case import create_cases_from_dataframe
+
+
+class CasesFromDataFrameTestCase(TestCase):
+
+    def test_cases_keep_row_ids_and_native_values(self):
+        data_frame = DataFrame(
+            {"legs": [4, 2], "hair": [True, False]}, index=["dog", "bird"]
+        )
+
+        cases = create_cases_from_dataframe(data_frame, name="Animal")
+
+        self.assertEqual(["dog", "bird"], [case._id for case in cases])
+        self.assertEqual(["Animal", "Animal"], [case._name for case in cases])
+        self.assertEqual({"legs": 4, "hair": True}, dict(cases[0]))
+        self.assertIs(type(cases[0]["legs"]), int)
+        self.assertIs(type(cases[1]["hair"]), bool)
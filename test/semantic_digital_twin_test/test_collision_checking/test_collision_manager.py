@@ -4,6 +4,10 @@ from krrood.symbolic_math.float_variable_data import (
     FloatVariableData,
 )
 from krrood.symbolic_math.symbolic_math import Vector, VariableParameters, FloatVariable
+from semantic_digital_twin.collision_checking.collision_detector import (
+    ClosestPoints,
+    CollisionCheckingResult,
+)
 from semantic_digital_twin.collision_checking.collision_matrix import (
     MaxAvoidedCollisionsOverride,
 )
@@ -122,6 +126,45 @@ class TestExternalCollisionExpressionManager:
         )
         assert np.allclose(result, expected)
 
+    def test_last_closest_contacts_keep_closest_per_group(self, cylinder_bot_world):
+        env1 = cylinder_bot_world.get_kinematic_structure_entity_by_name("environment")
+        env2 = cylinder_bot_world.get_kinematic_structure_entity_by_name("environment2")
+        robot = cylinder_bot_world.get_semantic_annotations_by_type(MinimalRobot)[0]
+        collision_manager = cylinder_bot_world.collision_manager
+        collision_manager.temporary_rules.append(
+            AvoidCollisionBetweenGroups(
+                buffer_zone_distance=15,
+                violated_distance=0.0,
+                body_group_a=[robot.root],
+                body_group_b=[env1, env2],
+            )
+        )
+        collision_manager.max_avoided_bodies_rules.append(
+            MaxAvoidedCollisionsOverride(1, {robot.root})
+        )
+        collision_manager.add_collision_consumer(
+            external_collisions := ExternalCollisionVariableManager(FloatVariableData())
+        )
+        external_collisions.register_group_of_body(robot.root)
+        collision_manager.update_collision_matrix()
+        group = external_collisions.get_collision_group(robot.root)
+
+        origin = np.array([0.0, 0.0, 0.0, 1.0])
+        normal = np.array([1.0, 0.0, 0.0, 0.0])
+        far_contact = ClosestPoints(robot.root, env1, 0.7, origin, origin, normal)
+        close_contact = ClosestPoints(env2, robot.root, 0.2, origin, origin, normal)
+        external_collisions.on_compute_collisions(
+            CollisionCheckingResult(contacts=[far_contact, close_contact])
+        )
+
+        contacts = external_collisions.last_closest_contacts[group]
+        assert len(contacts) == group.get_max_avoided_bodies(collision_manager)
+        assert contacts[0].body_a == robot.root
+        assert contacts[0].body_b == env2
+        assert contacts[0].distance == min(far_contact.distance, close_contact.distance)
+        contact_distance = external_collisions.get_contact_distance_symbol(group, 0)
+        assert np.allclose(contact_distance.evaluate()[0], close_contact.distance)
+
 
 class TestSelfCollisionExpressionManager:
     def test_simple(self, self_collision_bot_world):
@@ -268,6 +311,56 @@ class TestSelfCollisionExpressionManager:
         )
         assert np.allclose(contact_distance1.evaluate()[0], 100)
 
+    def test_collision_data_follows_moved_joints(self, self_collision_bot_world):
+        world = self_collision_bot_world
+        r_tip = world.get_kinematic_structure_entity_by_name("r_tip")
+        l_tip = world.get_kinematic_structure_entity_by_name("l_tip")
+        r_shoulder = world.get_kinematic_structure_entity_by_name("r_shoulder")
+        l_shoulder = world.get_kinematic_structure_entity_by_name("l_shoulder")
+        robot = world.get_semantic_annotations_by_type(MinimalRobot)[0]
+        collision_manager = world.collision_manager
+        collision_manager.temporary_rules.append(
+            AvoidSelfCollisions(
+                buffer_zone_distance=10,
+                violated_distance=0.23,
+                robot=robot,
+            )
+        )
+        collision_manager.max_avoided_bodies_rules.append(
+            MaxAvoidedCollisionsOverride(2, {robot.root})
+        )
+        collision_manager.add_collision_consumer(
+            self_collisions := SelfCollisionVariableManager(FloatVariableData())
+        )
+        self_collisions.register_groups_of_body_combination(l_tip, r_tip)
+        group_a, group_b = list(self_collisions.registered_group_combinations.keys())[0]
+        collision_manager.update_collision_matrix()
+        collision_manager.compute_collisions()
+        group_a_T_root_before = world.compute_forward_kinematics_np(
+            group_a.root, world.root
+        ).copy()
+
+        l_shoulder.parent_connection.position = 0.3
+        r_shoulder.parent_connection.position = -0.3
+        collision_manager.compute_collisions()
+
+        group_a_T_root = world.compute_forward_kinematics_np(group_a.root, world.root)
+        group_b_T_root = world.compute_forward_kinematics_np(group_b.root, world.root)
+        assert not np.allclose(group_a_T_root, group_a_T_root_before)
+        closest_contact = self_collisions.last_closest_contacts[(group_a, group_b)][0]
+        assert np.allclose(
+            self_collisions.get_group_a_P_point_on_a_symbol(
+                group_a, group_b
+            ).evaluate(),
+            group_a_T_root @ closest_contact.root_P_point_on_body_a,
+        )
+        assert np.allclose(
+            self_collisions.get_group_b_P_point_on_b_symbol(
+                group_a, group_b
+            ).evaluate(),
+            group_b_T_root @ closest_contact.root_P_point_on_body_b,
+        )
+
 
 def test_collision_rules_survive_merge(pr2_world_copy):
     expected = len(pr2_world_copy.collision_manager.rules)
@@ -598,6 +598,14 @@ class TestCollisionGroups:
         assert robot_base not in obstacle_group.bodies
         assert obstacle not in robot_base_group.bodies
 
+    def test_group_hash_survives_body_changes(self):
+        group = CollisionGroup(create_body_with_collision("root"))
+        registered_groups = {group: 0}
+
+        group.add_body(create_body_with_collision("child"))
+
+        assert registered_groups[group] == 0
+
     def test_is_collision_groups_combination_checked(self, pr2_world_state_reset):
         group_a = CollisionGroup(
             root=pr2_world_state_reset.bodies_with_collision[0],
@@ -12,6 +12,7 @@ import objgraph
 import pytest
 from numpy.testing import assert_raises
 
+from krrood.symbol_graph.symbol_graph import SymbolGraph
 from semantic_digital_twin.adapters.urdf import URDFParser
 from semantic_digital_twin.datastructures.prefixed_name import PrefixedName
 from semantic_digital_twin.exceptions import (
@@ -1947,3 +1948,17 @@ def test_is_kinematic_structure_entity_in_world_by_name(world_setup):
     world, l1, *_ = world_setup
     assert world.is_kinematic_structure_entity_in_world_by_name("l1")
     assert not world.is_kinematic_structure_entity_in_world_by_name("nonexistent")
+
+
+def test_get_body_in_branch_by_name(world_setup):
+    world, l1, l2, bf, r1, r2 = world_setup
+    assert world.get_body_in_branch_by_name(world.root, "l1") is l1
+    assert world.get_body_in_branch_by_name(world.root, l2.name) is l2
+    with pytest.raises(WorldEntityNotFoundError) as exc_info:
+        world.get_body_in_branch_by_name(l1, "r1")
+    assert "r1" not in {name.name for name in exc_info.value.suggestions}
+
+
+def test_prefixed_names_are_not_symbol_graph_instances():
+    name = PrefixedName("l1", "prefix")
+    assert SymbolGraph().get_wrapped_instance(name) is None